@@ -0,0 +1,77 @@
+#----------------------------------------------------------#
+# character_finder
+
+# Given an image, character_finder can be used
+# to split this image into images of individual characters,
+# and to find the text in the image
+
+# Created: December 09, 2020
+# Evan Warner
+#----------------------------------------------------------#
+
+import importlib
+
+
+# the module each function is defined in. Importing the package does not
+# import any of them, so that workers which only need the segmentation
+# functions (from character_finder.segmentation) start quickly, and PIL
+# is not imported until an image is opened
+MODULES = {
+    "segmentation": ["black_and_white", "increase_size", "increase_size_row",
+                     "split_lines", "split_chars", "get_runs",
+                     "get_coarse_runs", "is_inked",
+                     "merge_small_runs", "runs_to_splits", "get_gaps",
+                     "get_splits", "add_spaces", "find_spaces", "strip",
+                     "strip_bounds", "scale", "rem_double_chars",
+                     "skew_angle", "apportion"],
+    "images": ["LETTERS", "BW_PIXELS", "char_file", "get_pixels",
+               "get_pages", "frame_pixels", "frame_bw_pixels",
+               "image_pixels", "image_skew_angle", "deskew_image",
+               "rotation_matrix", "unrotate_box", "show_image",
+               "show_outline", "make_image", "save_default_chars",
+               "save_sheet"],
+    "features": ["get_squares", "outline", "path", "sample", "find_hole"],
+    "matching": ["closest_match", "closest_matches", "cascade_matches",
+                 "relative_margin", "match_squares", "match_outline",
+                 "get_limit", "add_match", "get_matches", "square_distance",
+                 "distance"],
+    "recognition": ["library", "default_library", "char_entry",
+                    "add_char", "replace_char", "remove_char", "get_text",
+                    "read_text", "read_pages", "read_pixels", "unrotate_boxes",
+                    "add_glyph", "low_confidence"],
+    "benchmark": ["render_page", "distort_page", "char_error_rate",
+                  "run_benchmark", "check_level", "print_results"],
+    "shared": ["save_library", "add_block", "attach_library",
+               "SharedLibrary", "SharedShape"],
+}
+
+
+
+def __getattr__(name):
+    """
+    __getattr__(Str) -> Any
+    
+    Imports the module a function is defined in the first time the function
+    is used from the package
+    """
+    
+    for module in MODULES:
+        if name in MODULES[module]:
+            return getattr(importlib.import_module("." + module, __name__), name)
+    
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+
+def __dir__():
+    """
+    __dir__() -> List
+    
+    Lists the functions of the package along with its own names
+    """
+    
+    names = list(globals())
+    for module in MODULES:
+        names.extend(MODULES[module])
+    
+    return names
@@ -0,0 +1,35 @@
+#----------------------------------------------------------#
+# __main__.py
+
+# Simplified use of character_finder from the command line:
+#     python -m character_finder
+#----------------------------------------------------------#
+
+from .images import save_default_chars
+from .recognition import get_text, default_library
+
+
+
+# Main function for simplified use
+# ----------------------------------------------------------------- 
+def user_interface():
+    
+    main_choice = input("Select an option:\n1. Save Default Characters\n2. Find Image Text\nSelection: ")
+    while main_choice != "1" and main_choice != "2":
+        main_choice = input("Invalid Selection!\n\nSelect an option:\n1. Save Default Characters\n2. Find Image Text\nSelection: ")
+    
+    if int(main_choice) == 1:
+        save_default_chars(input("Please enter the path to the image of a library: "))
+    
+    else:
+        des_method = input("Please enter the character recogniction method you would like to use (outline, squares or cascade): ")
+        while des_method != "outline" and des_method != "squares" and des_method != "cascade":
+            des_method = input("Please enter the character recogniction method you would like to use (outline, squares or cascade): ")
+        
+        text = get_text(input("Please enter the path to the image file you would like to translate into plain text: "), default_library(des_method), des_method)
+        print("This is the text we found:\n{}".format(text))
+
+
+
+if __name__ == "__main__":
+    user_interface()
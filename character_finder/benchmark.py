@@ -0,0 +1,314 @@
+#----------------------------------------------------------#
+# benchmark.py
+
+# Checks that changes keep the recognized text the same, and
+# measures the accuracy and speed of each method, using pages
+# of known text made from the library's character images:
+#     python -m character_finder.benchmark [--update]
+
+# The golden text depends on the character images in the
+# directory it is run from, which are not part of the repository,
+# so golden.json is kept locally (and ignored by git), not committed
+#----------------------------------------------------------#
+
+import json
+import os
+import random
+import sys
+import time
+
+from .images import LETTERS, char_file, image_skew_angle
+from .recognition import library, get_text
+
+
+# the known text of each page of the default corpus
+CORPUS = [
+    ["the quick brown fox", "jumps over the lazy dog"],
+    ["Pack my box with", "five dozen liquor jugs."],
+    ["How vexingly quick daft", "zebras jump, said Quinn."],
+]
+
+# the configurations to measure, as [name, method, threshold]
+CONFIGS = [
+    ["squares", "squares", 0.25],
+    ["outline", "outline", 0.25],
+    ["cascade 0.25", "cascade", 0.25],
+    ["cascade 0.5", "cascade", 0.5],
+]
+
+# the ways each page is distorted, so the methods must match characters
+# which are not exact copies of the library, as [name, scale, angle (in
+# degrees), blur radius, fraction of pixels flipped by noise]
+DISTORTIONS = [
+    ["clean", 1, 0, 0, 0],
+    ["scaled", 0.8, 0, 0.5, 0],
+    ["rotated", 1, 1.5, 0, 0],
+    ["noisy", 0.9, 0.5, 0.7, 0.0005],
+]
+
+# characters which hang below the line, and how far (as a fraction of
+# their height)
+DESCENDERS = {"g": 0.3, "j": 0.3, "p": 0.3, "q": 0.3, "y": 0.3, ",": 0.5}
+
+
+
+# Functions for making pages of known text
+# -----------------------------------------------------------------
+def render_page(lines, save, gap=6, space=24):
+    """
+    render_page(List, Str, Nat, Nat) -> None
+    
+    Saves an image of the given lines of text, made by placing the image of
+    each character (see char_file) side by side, gap pixels apart, with
+    spaces space pixels wide
+    """
+    
+    from PIL import Image
+    
+    # open the image of each character once
+    chars = {}
+    for line in lines:
+        for letter in line:
+            if letter != " " and letter not in chars:
+                chars[letter] = Image.open(char_file(letter)).convert("RGB")
+    
+    # find the size of the page, leaving room for the tallest character
+    # and its descender on each line
+    height = 0
+    width = 0
+    for letter in chars:
+        height = max(height, chars[letter].height)
+    for line in lines:
+        line_width = 0
+        for letter in line:
+            if letter == " ":
+                line_width += space
+            else:
+                line_width += chars[letter].width+gap
+        width = max(width, line_width)
+    line_height = height*2
+    
+    im = Image.new("RGB", (width+2*gap, line_height*len(lines)+gap),
+                   (255,255,255))
+    
+    # place the bottom of each character on the line, lowering descenders
+    for row in range(len(lines)):
+        x = gap
+        base = line_height*row+height+gap
+        for letter in lines[row]:
+            if letter == " ":
+                x += space
+                continue
+            
+            char = chars[letter]
+            drop = int(char.height*DESCENDERS.get(letter, 0))
+            im.paste(char, (x, base-char.height+drop))
+            x += char.width+gap
+    
+    im.save(save)
+
+
+
+def distort_page(page, save, distortion, seed=0):
+    """
+    distort_page(Str, Str, List, Nat) -> None
+    
+    Saves a copy of the image page with the given distortion (see
+    DISTORTIONS) applied. The noise is chosen using seed, so the same page
+    is made every time
+    """
+    
+    from PIL import Image, ImageFilter
+    
+    im = Image.open(page).convert("RGB")
+    
+    if distortion[1] != 1:
+        im = im.resize((max(1, int(im.width*distortion[1])),
+                        max(1, int(im.height*distortion[1]))), Image.BILINEAR)
+    
+    if distortion[2] != 0:
+        im = im.rotate(distortion[2], Image.BILINEAR, True,
+                       fillcolor=(255,255,255))
+    
+    if distortion[3] != 0:
+        im = im.filter(ImageFilter.GaussianBlur(distortion[3]))
+    
+    # flip random pixels to black or white
+    rand = random.Random(seed)
+    for i in range(int(im.width*im.height*distortion[4])):
+        colour = rand.choice([(0,0,0), (255,255,255)])
+        im.putpixel((rand.randrange(im.width), rand.randrange(im.height)), colour)
+    
+    im.save(save)
+
+
+
+def char_error_rate(expected, found):
+    """
+    char_error_rate(Str, Str) -> Num
+    
+    Returns the number of characters which must be added, removed or changed
+    to turn found into expected (the edit distance), as a fraction of the
+    length of expected
+    """
+    
+    # find the edit distance one row at a time
+    prev = list(range(len(found)+1))
+    for i in range(1, len(expected)+1):
+        row = [i]
+        for ii in range(1, len(found)+1):
+            cost = 0
+            if expected[i-1] != found[ii-1]:
+                cost = 1
+            row.append(min(prev[ii]+1, row[ii-1]+1, prev[ii-1]+cost))
+        prev = row
+    
+    return prev[-1]/max(1, len(expected))
+
+
+
+# Functions for measuring the methods
+# -----------------------------------------------------------------
+def run_benchmark(corpus=False, configs=False, letters=False,
+                  golden="golden.json", update=False, distortions=False):
+    """
+    run_benchmark(List, List, List, Str, Bool, List) -> List
+    
+    Renders each page of corpus (see render_page), distorts it in each of
+    the given ways (see distort_page), and reads the pages of each
+    distortion with each configuration. Returns a list of [name, character
+    error rate, seconds to build the library, seconds to read the pages,
+    pages changed, pages failed], one for each configuration and distortion,
+    where pages changed is the number of pages whose text differs from the
+    golden text saved in the file golden, and pages failed is the number of
+    pages which could not be read (their text is counted as empty). If
+    there is no golden text for a configuration and distortion, or update
+    is True, the text found is saved as the golden text instead
+    """
+    
+    if not corpus:
+        corpus = CORPUS
+    if not configs:
+        configs = CONFIGS
+    if not letters:
+        letters = LETTERS
+    if not distortions:
+        distortions = DISTORTIONS
+    
+    # render the pages, then distort them
+    pages = []
+    for distortion in distortions:
+        pages.append([])
+    for i in range(len(corpus)):
+        clean = "bench_page_{}.png".format(i)
+        render_page(corpus[i], clean)
+        for ii in range(len(distortions)):
+            pages[ii].append("bench_page_{}_{}.png".format(i, distortions[ii][0]))
+            distort_page(clean, pages[ii][-1], distortions[ii], i)
+    
+    saved = {}
+    if os.path.exists(golden):
+        with open(golden) as f:
+            saved = json.load(f)
+    
+    # build each library once, and time it
+    libs = {}
+    results = []
+    for config in configs:
+        lib_time = 0
+        if config[1] not in libs:
+            start = time.time()
+            libs[config[1]] = library(letters, config[1])
+            lib_time = time.time()-start
+        
+        for ii in range(len(distortions)):
+            name = "{} {}".format(config[0], distortions[ii][0])
+            
+            # read every page, and compare it to the known and golden text
+            texts = []
+            errors = 0
+            failed = 0
+            start = time.time()
+            for page in pages[ii]:
+                try:
+                    texts.append(get_text(page, libs[config[1]], config[1], config[2]))
+                except Exception:
+                    texts.append("")
+                    failed += 1
+            read_time = time.time()-start
+            
+            # golden text saved for a different corpus is replaced
+            known = name in saved and len(saved[name]) == len(texts)
+            changed = 0
+            for i in range(len(texts)):
+                errors += char_error_rate("\n".join(corpus[i]), texts[i])
+                if known and not update and saved[name][i] != texts[i]:
+                    changed += 1
+            
+            if not known or update:
+                saved[name] = texts
+            
+            results.append([name, errors/len(texts), lib_time, read_time,
+                            changed, failed])
+            lib_time = 0
+    
+    with open(golden, "w") as f:
+        json.dump(saved, f, indent=4)
+    
+    return results
+
+
+
+def check_level(corpus=False):
+    """
+    check_level(List) -> List
+    
+    Renders each page of corpus, each line of it, and each word of it on its
+    own (see render_page), none of which are rotated, and returns a list of
+    [text, angle] for each one whose angle is not found to be 0 (see
+    image_skew_angle)
+    """
+    
+    from PIL import Image
+    
+    if not corpus:
+        corpus = CORPUS
+    
+    # short texts have the least ink, so are the most likely to be wrong
+    texts = []
+    for page in corpus:
+        texts.append(page)
+        for line in page:
+            texts.append([line])
+            for word in line.split(" "):
+                texts.append([word])
+    
+    skewed = []
+    for text in texts:
+        render_page(text, "bench_page_level.png")
+        angle = image_skew_angle(Image.open("bench_page_level.png").convert("RGB"))
+        if angle != 0:
+            skewed.append(["\n".join(text), angle])
+    
+    return skewed
+
+
+
+def print_results(results):
+    """
+    print_results(List) -> None
+    
+    Prints the results of run_benchmark as a table
+    """
+    
+    print("{:<22}{:>8}{:>10}{:>10}{:>9}{:>8}".format("config", "CER", "library", "read", "changed", "failed"))
+    for result in results:
+        print("{:<22}{:>8.3f}{:>9.2f}s{:>9.2f}s{:>9}{:>8}".format(*result))
+
+
+
+if __name__ == "__main__":
+    print_results(run_benchmark(update="--update" in sys.argv))
+    
+    for item in check_level():
+        print("level text {!r} was found to be rotated by {} degrees".format(*item))
@@ -0,0 +1,202 @@
+#----------------------------------------------------------#
+# features.py
+
+# The attributes of a character used to recognize it, for
+# each of the recognition methods
+#----------------------------------------------------------#
+
+from .segmentation import scale, apportion
+
+
+
+# Method 1 for recognizing characters
+# -----------------------------------------------------------------
+def get_squares(pixels):
+    """
+    get_squares(List) -> List
+    
+    Given a list of pixels, returns the % of black pixels in 25 equal sized
+    sections of the list
+    """
+    
+    # scale the images, so the squares can be evenly sized
+    pixels = scale(pixels, len(pixels)*5, len(pixels[0])*5)
+    heights = apportion(len(pixels), 5)
+    widths = apportion(len(pixels[0]), 5)
+    
+    # iterate through each segment, and find the % of black pixels in each
+    squares = []
+    for i in range(len(heights)-1):
+        for ii in range(len(widths)-1):
+            
+            bp = 0
+            counter = 0
+            for row in range(heights[i], heights[i+1]):
+                for col in range(widths[i], widths[i+1]):
+                    if pixels[row][col] == (0,0,0):
+                        bp += 1
+                    counter += 1
+                    
+            squares.append(bp/counter) 
+    
+    return squares
+
+
+# Method 2 for recognizing characters
+# -----------------------------------------------------------------
+def outline(pixels):    
+    """
+    outline(List) -> List
+    
+    Returns a list of points which represent a list of coordinates for the
+    two largest shapes (or one if there is only one sufficiently large shape)
+    for a given list of pixels
+    """
+    
+    # create a one pixel "buffer" surrounding the image
+    trow = [(255,255,255)]*(len(pixels[0])+2)
+    new_pixels = []
+    new_pixels.append(trow)
+    for row in range(len(pixels)):
+        new_row = [(255,255,255)]
+        new_row.extend(pixels[row])
+        new_row.append((255,255,255))
+        new_pixels.append(new_row)
+    new_pixels.append(trow)
+    pixels = new_pixels[:]
+        
+    out = []
+    
+    # iterate through every pixel, and if the pixel is black and has a white
+    # pixel adjacent, it is likely to be a coordinate for the outline of the
+    # list of pixels, so append it to out
+    for row in range(1,len(pixels)-1):
+        for col in range(1,len(pixels[row])-1):
+            if pixels[row][col] == (0,0,0):
+                if pixels[row][col+1] != (0,0,0) or pixels[row][col-1] != (0,0,0) or pixels[row-1][col] != (0,0,0) or pixels[row+1][col] != (0,0,0) or pixels[row-1][col-1] != (0,0,0) or pixels[row+1][col+1] != (0,0,0):
+                    out.append([col,row])
+    
+    # find all the different shapes in out, using path
+    orig = out[:]
+    outlines = []
+    while out != []:
+        tpath = [out[0]]
+        out = out[1:]
+        temp = path(tpath[-1], out)
+        
+        while temp != None:
+            tpath.append(temp)
+            out.remove(temp)
+            temp = path(tpath[-1], out)
+            
+        outlines.append(tpath)
+    
+    # find the two largest shapes
+    two_shapes = []
+    longest = [-1,-1]
+    for outl in outlines:
+        if len(outl) > longest[1]:
+            longest = [outl, len(outl)]
+    two_shapes.append(longest[0])
+    outlines.remove(longest[0])
+    
+    if outlines != []:
+        longest = [-1,-1]
+        for outl in outlines:
+            if len(outl) > longest[1]:
+                longest = [outl, len(outl)]
+        
+        # if the second shape is big enough, keep it   
+        if longest[1] > len(two_shapes[0])/10:
+            two_shapes.append(longest[0])
+    
+    # return the outlines of the two largest shapes
+    return two_shapes
+
+
+
+def path(c, coords):
+    """
+    path(List, List) -> List or None
+    
+    Given a coordinate (c), and a list of coordinates (coords), returns
+    a coordinate in coords if it can be reached by (c) or none otherwise
+    """
+    
+    # directions (c) can travel to reach a coordinate
+    modifs = [[0,1],[1,1],[1,0],[1,-1],[0,-1],[-1,-1],[-1,0],[-1,1],[0,2],[1,2],
+              [2,2],[2,1],[2,0],[2,-1],[2,-2],[1,-2],[0,-2],[-1,-2],[-2,-2],
+              [-2,-1],[-2,0],[-2,1],[-2,2],[-1,2],[0,3],[1,3],[2,3],[3,3],[3,2],
+              [3,1],[3,0],[3,-1],[3,-2],[3,-3],[2,-3],[1,-3],[0,-3],[-1,-3],
+              [-2,-3],[-3,-3],[-3,-2],[-3,-1],[-3,0],[-3,1],[-3,2],[-3,3]]
+    
+    # check if any of these paths lead to coordinates in coords
+    for mod in modifs:
+        if [c[0]+mod[0],c[1]+mod[1]] in coords:
+            # if so, return the coordinate
+            return [c[0]+mod[0],c[1]+mod[1]] 
+
+
+
+def sample(coords, n):
+    """
+    sample(List, Nat) -> List
+    
+    Samples n points from coords, spaced evenly, and returns the
+    sampled points in a list
+    """
+    
+    # find the indeces
+    ind = apportion(len(coords)-1, n)
+    
+    new_coords = []
+    for index in ind:
+        
+        # ensure points are not sampled twice
+        if coords[index] not in new_coords:
+            new_coords.append(coords[index])
+    
+    return new_coords
+
+
+
+def find_hole(out):
+    """
+    out(List) -> Nat
+    
+    Given an outline, returns the location of the hole in the character
+    """
+    
+    # NOTES
+    # 0 -> no hole
+    # 1 -> hole in lower half
+    # 2 -> hole in middle
+    # 3 -> hole in upper half
+    
+    # set default to be 'no hole'
+    hole = 0
+    
+    # find the max and min y coords
+    if len(out) > 1:
+        maxy = -1
+        miny = -1
+        for c in out[1]:
+            if c[1] > maxy:
+                maxy = c[1]
+            elif c[1] < miny or miny == -1:
+                miny = c[1]
+        
+        maxy2 = -1
+        for c in out[0]:
+            if c[1] > maxy2:
+                maxy2 = c[1]      
+        
+        # check if the max and min are near the top, the bottom, or in the middle
+        if miny > 100:
+            hole = 1
+        elif maxy < 100:
+            hole = 3
+        else:
+            hole = 2 
+            
+    return hole
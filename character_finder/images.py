@@ -0,0 +1,416 @@
+#----------------------------------------------------------#
+# images.py
+
+# Opening, showing and saving images. PIL is only imported
+# the first time one of these functions is used
+#----------------------------------------------------------#
+
+import math
+import os
+
+from .segmentation import (black_and_white, increase_size, split_lines,
+                           split_chars, strip, skew_angle)
+
+
+# the default characters, in the order they appear in an alphabet image
+LETTERS = ["a","b","c","d","e","f","g","h","i","j","k","l","m","n","o","p","q","r","s","t","u","v","w","x","y","z","A","B","C","D","E","F","G","H","I","J","K","L","M","N","O","P","Q","R","S","T","U","V","W","X","Y","Z",".",","]
+
+
+
+# the black or white pixel for each value of half the sum of a pixel's red,
+# green and blue (see frame_bw_pixels)
+BW_PIXELS = tuple([(0,0,0)]*233 + [(255,255,255)]*23)
+
+
+
+# functions for opening and saving images
+# -----------------------------------------------------------------
+def char_file(letter):
+    """
+    char_file(Str) -> Str
+    
+    Returns the name of the image file of the given letter, as saved by
+    save_default_chars
+    """
+    
+    if letter.islower() or not letter.isalpha():
+        return "char_{}.png".format(letter)
+    
+    return "char__{}.png".format(letter)
+
+
+
+def get_pixels(img, deskew=False, transform=False, bw=False):
+    """
+    get_pixels(Image, Bool, List, Bool) -> List
+    
+    Returns a list of rows of columns of pixels in a given Image. If deskew
+    is True, the image is first rotated so its lines of text are level
+    (see deskew_image), and if a list is given for transform, the rotation
+    is added to it. If bw is True, the pixels are made black and white and
+    increased to 3x their size (see frame_bw_pixels)
+    """
+    
+    from PIL import Image
+    
+    if bw:
+        return frame_bw_pixels(Image.open(img), deskew, transform)
+    
+    return frame_pixels(Image.open(img), deskew, transform)
+
+
+
+def get_pages(img, deskew=False, transforms=False, bw=False):
+    """
+    get_pages(Image, Bool, List, Bool) -> Generator
+    
+    Yields a list of rows of columns of pixels (see get_pixels) for each page
+    (frame) of a given Image, such as a multipage TIFF, in order. Only one
+    page is decoded at a time. If a list is given for transforms, the
+    rotation of each page (see deskew_image) is added to it before the page
+    is yielded
+    """
+    
+    from PIL import Image, ImageSequence
+    
+    im = Image.open(img)
+    for frame in ImageSequence.Iterator(im):
+        transform = []
+        if bw:
+            pixels = frame_bw_pixels(frame, deskew, transform)
+        else:
+            pixels = frame_pixels(frame, deskew, transform)
+        if transforms is not False:
+            transforms.append(transform)
+        
+        yield pixels
+
+
+
+def frame_pixels(im, deskew=False, transform=False):
+    """
+    frame_pixels(Image, Bool, List) -> List
+    
+    Returns a list of rows of columns of pixels in an opened image, or in its
+    current frame (see get_pixels)
+    """
+    
+    # in case the given image is not in RGB form, convert it
+    im = im.convert("RGB")
+    
+    if deskew:
+        im = deskew_image(im, transform)
+    
+    return image_pixels(im)
+
+
+
+def frame_bw_pixels(im, deskew=False, transform=False):
+    """
+    frame_bw_pixels(Image, Bool, List) -> List
+    
+    Returns the same pixels as black_and_white(increase_size(frame_pixels(im,
+    deskew, transform))), but the image is made black and white, and 3x as
+    wide, by PIL. PIL lets other threads run while it works, so pages can be
+    prepared in the background while another page is read (see read_pages)
+    """
+    
+    from PIL import Image
+    
+    im = im.convert("RGB")
+    if deskew:
+        im = deskew_image(im, transform)
+    
+    # half of the sum of the red, green and blue of a pixel is less than 233
+    # exactly when the sum is less than 465 (see black_and_white)
+    im = im.convert("L", matrix=(0.5, 0.5, 0.5, 0))
+    im = im.resize((im.width*3, im.height), Image.NEAREST)
+    
+    # look up the black or white pixel for each value, and repeat each row
+    # 3 times, as increase_size does
+    data = im.tobytes()
+    pixels = []
+    for row in range(im.height):
+        start = row*im.width
+        new_row = list(map(BW_PIXELS.__getitem__, data[start:start+im.width]))
+        pixels.extend([new_row]*3)
+    
+    return pixels
+
+
+
+def image_pixels(im):
+    """
+    image_pixels(Image) -> List
+    
+    Returns a list of rows of columns of pixels in an opened RGB image, read
+    from its raw bytes rather than one pixel at a time
+    """
+    
+    data = im.tobytes()
+    
+    #iterate through the image, and append each individual pixel to our list
+    pixels = []
+    for row in range(im.height):
+        start = row*im.width*3
+        temp_row = []
+        for i in range(start, start+im.width*3, 3):
+            temp_row.append((data[i], data[i+1], data[i+2]))
+            
+        pixels.append(temp_row)
+    
+    return pixels
+
+
+
+def image_skew_angle(im):
+    """
+    image_skew_angle(Image) -> Num
+    
+    Returns the angle, in degrees, the lines of text in an RGB image are
+    rotated by, found using a small copy of the image (see skew_angle)
+    """
+    
+    # reduce the image to about 500 pixels across, which is enough to find
+    # the angle to within half a degree
+    factor = max(1, max(im.size)//500)
+    small = im.reduce(factor)
+    
+    # get a black and white list of the pixels of the small image
+    return skew_angle(black_and_white(image_pixels(small)))
+
+
+
+def deskew_image(im, transform=False):
+    """
+    deskew_image(Image, List) -> Image
+    
+    Finds the angle the lines of text in an RGB image are rotated by (see
+    image_skew_angle), and returns the image rotated back by that angle,
+    enlarged to fit all of it. If a list is given for transform, [angle,
+    matrix, size] is added to it, where matrix maps the rotated image back
+    to the original image of the given size (see rotation_matrix)
+    """
+    
+    from PIL import Image
+    
+    angle = image_skew_angle(im)
+    rotation = rotation_matrix(im.size, angle)
+    if transform is not False:
+        transform.extend([angle, rotation[1], im.size])
+    
+    if angle == 0:
+        return im
+    
+    return im.transform(rotation[0], Image.AFFINE, rotation[1],
+                        Image.BILINEAR, fillcolor=(255,255,255))
+
+
+
+def rotation_matrix(size, angle):
+    """
+    rotation_matrix(Tuple, Num) -> List
+    
+    Returns [new size, matrix] for rotating an image of the given size
+    anticlockwise by angle degrees about its centre, enlarged to fit all of
+    it (as Image.rotate does with expand). The matrix [a, b, c, d, e, f] maps
+    each point (x, y) of the rotated image to the point (ax+by+c, dx+ey+f)
+    of the original image
+    """
+    
+    width, height = size
+    cos = round(math.cos(math.radians(-angle)), 15)
+    sin = round(math.sin(math.radians(-angle)), 15)
+    
+    # find the size of the rotated image from where its corners go
+    xs = []
+    ys = []
+    for x, y in [[0, 0], [width, 0], [width, height], [0, height]]:
+        xs.append(cos*(x-width/2)+sin*(y-height/2))
+        ys.append(-sin*(x-width/2)+cos*(y-height/2))
+    new_width = math.ceil(max(xs))-math.floor(min(xs))
+    new_height = math.ceil(max(ys))-math.floor(min(ys))
+    
+    # rotate about the centre of the rotated image, back to the centre of
+    # the original image
+    x = -new_width/2
+    y = -new_height/2
+    matrix = [cos, sin, cos*x+sin*y+width/2,
+              -sin, cos, -sin*x+cos*y+height/2]
+    
+    return [(new_width, new_height), matrix]
+
+
+
+def unrotate_box(box, transform):
+    """
+    unrotate_box(List, List) -> List
+    
+    Given the [left, top, right, bottom] of a box in an image rotated by
+    deskew_image, and the transform it gave, returns the smallest box in the
+    original image which holds all of it
+    """
+    
+    matrix = transform[1]
+    xs = []
+    ys = []
+    for x, y in [[box[0], box[1]], [box[2], box[1]], [box[2], box[3]], [box[0], box[3]]]:
+        xs.append(matrix[0]*x+matrix[1]*y+matrix[2])
+        ys.append(matrix[3]*x+matrix[4]*y+matrix[5])
+    
+    # keep the box inside the original image
+    width, height = transform[2]
+    return [max(0, math.floor(min(xs))), max(0, math.floor(min(ys))),
+            min(width, math.ceil(max(xs))), min(height, math.ceil(max(ys)))]
+
+
+
+def show_image(pixels, red=False, save=False):
+    """
+    show_image(List, Bool, Bool) -> None
+    
+    Shows the image corresponding to the given list of pixels. If red is True,
+    then every white pixel in pixels is replaced with a red pixel, otherwise
+    each pixel is unaltered
+    """
+    
+    # if red is True, each white pixel in pixels is replaced with a red pixel
+    if red:
+        new_pixels = []
+        for row in pixels:
+            new_row = []
+            for pixel in row:
+                if pixel == (255,255,255):
+                    new_row.append((255,0,0))
+                else:
+                    new_row.append(pixel)
+            new_pixels.append(new_row)
+        pixels = new_pixels
+    
+    # create a new image from pixels
+    img = make_image(pixels)
+    
+    #either save or show the image 
+    if save != False:
+        img.save(save)
+    
+    else:
+        img.show()
+
+
+
+def show_outline(coords):
+    """
+    show_outline(List) -> None
+    
+    Shows a 500x500 image with the given list of [col, row] coordinates in
+    black
+    """
+    
+    from PIL import Image
+    
+    # start with a white image, then set each coordinate to black
+    data = [(255,255,255)]*(500*500)
+    for c in coords:
+        if 0 <= c[0] < 500 and 0 <= c[1] < 500:
+            data[c[1]*500+c[0]] = (0,0,0)
+    
+    im = Image.new("RGB", (500, 500))
+    im.putdata(data)
+    im.show()
+
+
+
+def make_image(pixels):
+    """
+    make_image(List) -> Image
+    
+    Returns a new image with the given list of pixels, built in one call
+    rather than one pixel at a time
+    """
+    
+    from PIL import Image
+    
+    data = []
+    for row in pixels:
+        data.extend(row)
+    
+    img = Image.new("RGB", (len(pixels[0]), len(pixels)))
+    img.putdata(data)
+    
+    return img
+
+
+
+def save_default_chars(alphabet, sheet=False):
+    """
+    save_default_chars(Image, Str) -> None
+    
+    Given an image of an alphabet, in order a-z from left to right,
+    saves an image of each character to the folder this program is in.
+    If sheet is given, all the characters are instead saved side by side in
+    one image with that name, along with an index of where each character
+    is (see save_sheet)
+    """
+    
+    letters = LETTERS
+    
+    # create a black and white version of the image, and split it into lines
+    pixels = black_and_white(increase_size(get_pixels(alphabet)))
+    # (the pixels were increased to 3x their size, so the lines are found
+    # in blocks of 3 rows, and each repeated row is only checked once)
+    lines = split_lines(pixels, False, False, 3)
+    
+    # find each letter on each line, and add it to a list of chars
+    chars = []
+    for line in lines:
+        line_text = split_chars(line)
+        for char in line_text:
+            if char != -1:
+                chars.append(strip(char))
+    
+    if sheet != False:
+        save_sheet(chars, letters, sheet)
+        return
+    
+    # iterate through this list of chars, and save them
+    for i in range(len(chars)):
+        
+        # create a new image of the char
+        im = make_image(chars[i])
+        
+        # save this new image
+        im.save(char_file(letters[i]))
+
+
+
+def save_sheet(chars, letters, sheet):
+    """
+    save_sheet(List, List, Str) -> None
+    
+    Saves the given chars side by side in one image named sheet, and writes
+    an index next to it (with the extension .txt), where each line is the
+    letter, x, y, width and height of a char in the image
+    """
+    
+    from PIL import Image
+    
+    # find the size of the sheet, leaving a white col between chars
+    width = 0
+    height = 0
+    for char in chars:
+        width += len(char[0])+1
+        height = max(height, len(char))
+    
+    # paste each char into the sheet, and note where it is
+    im = Image.new("RGB", (width, height), (255,255,255))
+    index = []
+    x = 0
+    for i in range(len(chars)):
+        im.paste(make_image(chars[i]), (x, 0))
+        index.append("{} {} {} {} {}".format(letters[i], x, 0, len(chars[i][0]), len(chars[i])))
+        x += len(chars[i][0])+1
+    
+    im.save(sheet)
+    with open(os.path.splitext(sheet)[0]+".txt", "w") as f:
+        f.write("\n".join(index)+"\n")
@@ -0,0 +1,271 @@
+#----------------------------------------------------------#
+# matching.py
+
+# Finds the known characters in a library which most
+# resemble an unknown character
+#----------------------------------------------------------#
+
+from .segmentation import scale
+from .features import get_squares, outline, sample, find_hole
+
+
+
+# Functions for matching characters
+# -----------------------------------------------------------------
+def closest_match(pixels, lib, avg, method="squares"):    
+    """
+    closest_match(List, List, Num) -> Str
+    
+    Given a list of pixels of a unknown character, and a library of attributes
+    for known characters, outputs the known character which most resembles the
+    unknown character. Permitted methods are "squares" and "outline"
+    """
+    
+    # check if the character should be a space
+    if pixels == -1:
+        return " "
+    
+    matches = closest_matches(pixels, lib, avg, method)
+    
+    # check if the character was too small, and was ignored
+    if matches == []:
+        return ""
+    
+    return matches[0][0]
+
+
+
+def closest_matches(pixels, lib, avg, method="squares", k=1):
+    """
+    closest_matches(List, List, Num, Str, Nat) -> List
+    
+    Given a list of pixels of a unknown character, and a library of attributes
+    for known characters, returns the k known characters which most resemble
+    the unknown character, as a list of [char, score, margin] (see
+    match_squares), or an empty list if the character is too small
+    """
+    
+    # check if the character is too small, and should be ignored
+    if len(pixels)*len(pixels[0]) < avg/10:
+        return []
+    
+    # otherwise, attempt to find its closest matches, using the given method
+    if method == "outline":
+        # scale the unknown character to match the library, and find its
+        # outline
+        pixels = scale(pixels, 200, 200)
+        return match_outline(outline(pixels), lib, k)
+    
+    # get the squares for the pixels
+    return match_squares(get_squares(pixels), lib, k)
+
+
+
+def cascade_matches(pixels, lib, avg, k=1, threshold=0.25):
+    """
+    cascade_matches(List, List, Num, Nat, Num) -> List
+    
+    Given a list of pixels of a unknown character, and a library built with
+    the "cascade" method, finds its closest matches using the squares method,
+    and only if they are ambiguous (see relative_margin), using the outline
+    method. Returns [matches, escalated], where escalated is True if the
+    outline method was used
+    """
+    
+    # at least two matches are needed to tell if the squares are ambiguous
+    matches = closest_matches(pixels, lib[0], avg, "squares", max(k, 2))
+    if matches == [] or relative_margin(matches) >= threshold:
+        return [matches[:k], False]
+    
+    # keep the squares matches if there is no outline with the same hole
+    outline_matches = closest_matches(pixels, lib[1], avg, "outline", k)
+    if outline_matches == []:
+        return [matches[:k], False]
+    
+    return [outline_matches, True]
+
+
+
+def relative_margin(matches):
+    """
+    relative_margin(List) -> Num
+    
+    Given a list of the closest matches of a character (see match_squares),
+    returns how much closer the closest match is than the second closest,
+    as a fraction of the second closest's score
+    """
+    
+    if len(matches) < 2 or matches[1][1] == 0:
+        return 0
+    
+    return matches[1][2]/matches[1][1]
+
+
+
+def match_squares(squares, lib, k=1):
+    """
+    match_squares(List, List, Nat) -> List
+    
+    Given the squares of an unknown character, and a library of squares for
+    known characters, returns the k closest known characters as a list of
+    [char, score, margin], from closest to farthest, where margin is how much
+    farther the character is than the closest one
+    """
+    
+    # since (a1-b1)^2 + ... + (an-bn)^2 >= ((a1+...+an) - (b1+...+bn))^2 / n,
+    # the difference in total ink is a lower bound for the score, so check
+    # the characters in order of this bound
+    ink = sum(squares)
+    bounds = []
+    for i in range(len(lib)):
+        bounds.append([(ink-lib[i][2])**2/len(squares), i])
+    bounds.sort()
+    
+    best = []
+    for bound in bounds:
+        # once the bound is worse than the kth best score, none of the
+        # remaining characters can be closer
+        if len(best) == k and bound[0] > best[-1][0]:
+            break
+        
+        diff = square_distance(squares, lib[bound[1]][1], get_limit(best, k))
+        best = add_match(best, k, diff, bound[1])
+    
+    return get_matches(best, lib)
+
+
+
+def match_outline(out, lib, k=1):
+    """
+    match_outline(List, List, Nat) -> List
+    
+    Given the outline of an unknown character, and a library of outlines for
+    known characters, returns the k closest known characters with the same
+    kind of hole, as a list of [char, score, margin] (see match_squares)
+    """
+    
+    # find the number of points to sample from each shape
+    n = 200
+    size = 0
+    for shape in out:
+        if len(shape) < n:
+            n = len(shape)-1
+        size += len(shape)
+    
+    hole = find_hole(out)
+    samples = []
+    for shape in out:
+        samples.append(sample(shape, n))
+    
+    # check the characters with outlines of a similar size first, so a close
+    # match is found early, and the rest can be abandoned sooner
+    order = []
+    for i in range(len(lib)):
+        if hole == lib[i][1]:
+            order.append([abs(lib[i][3]-size), i])
+    order.sort()
+    
+    best = []
+    for item in order:
+        limit = get_limit(best, k)
+        
+        # stop comparing shapes as soon as the score is worse than the limit
+        diff = 0
+        for i in range(len(samples)):
+            sample2 = sample(lib[item[1]][2][i], n)
+            if limit == -1:
+                diff += distance(samples[i], sample2)
+            else:
+                diff += distance(samples[i], sample2, limit-diff)
+                if diff > limit:
+                    break
+        
+        best = add_match(best, k, diff, item[1])
+    
+    return get_matches(best, lib)
+
+
+
+def get_limit(best, k):
+    """
+    get_limit(List, Nat) -> Num
+    
+    Returns the score a character must not exceed to be one of the k best,
+    or -1 if there are not yet k matches
+    """
+    
+    if len(best) < k:
+        return -1
+    
+    return best[-1][0]
+
+
+
+def add_match(best, k, score, index):
+    """
+    add_match(List, Nat, Num, Nat) -> List
+    
+    Adds the [score, index] of a character to the sorted list of the k best
+    matches, if it is good enough. Ties are broken by the library index
+    """
+    
+    if len(best) == k and [score, index] > best[-1]:
+        return best
+    
+    best.append([score, index])
+    best.sort()
+    
+    return best[:k]
+
+
+
+def get_matches(best, lib):
+    """
+    get_matches(List, List) -> List
+    
+    Converts a list of [score, index] matches into a list of
+    [char, score, margin]
+    """
+    
+    matches = []
+    for match in best:
+        matches.append([lib[match[1]][0], match[0], match[0]-best[0][0]])
+    
+    return matches
+
+
+
+def square_distance(s1, s2, limit=-1):
+    """
+    square_distance(List, List, Num) -> Num
+    
+    Returns the sum of the squared differences between two lists of squares.
+    If a limit is given, the sum is abandoned as soon as it exceeds the limit
+    """
+    
+    diff = 0
+    for i in range(len(s1)):
+        diff += (s1[i]-s2[i])**2
+        if limit != -1 and diff > limit:
+            break
+    
+    return diff
+
+
+
+def distance(c1, c2, limit=-1):
+    """
+    distance(List, List, Num) -> Num
+    
+    Returns the cartesian distance between two lists of points. If a limit
+    is given, the sum is abandoned as soon as it exceeds the limit
+    """
+    dist = 0
+    
+    # sampling may drop repeated points, so only compare the common points
+    for i in range(min(len(c1), len(c2))):
+        dist += (((c1[i][0]-c2[i][0])**2) + ((c1[i][1]-c2[i][1])**2))**0.5
+        if limit != -1 and dist > limit:
+            break
+    
+    return dist
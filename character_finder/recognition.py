@@ -0,0 +1,466 @@
+#----------------------------------------------------------#
+# recognition.py
+
+# Builds libraries of known characters, and finds the text
+# in an image using them
+#----------------------------------------------------------#
+
+import queue
+import threading
+
+from .images import LETTERS, char_file, get_pixels, get_pages, unrotate_box
+from .segmentation import (black_and_white, increase_size, split_lines,
+                           split_chars, get_runs, add_spaces, strip,
+                           strip_bounds, scale, rem_double_chars)
+from .features import get_squares, outline, find_hole
+from .matching import closest_matches, cascade_matches, relative_margin
+
+
+# libraries built by default_library, by method
+LIBRARIES = {}
+
+
+
+# Functions for Character Recognition
+# -----------------------------------------------------------------
+def library(letters=False, method="squares"):
+    """
+    library() -> List
+    
+    Generates a list of the characteristics for the given method of each 
+    character with an image file in the same directory. The "cascade" method
+    needs both, so it returns [squares library, outline library]
+    """
+    
+    if method == "cascade":
+        return [library(letters, "squares"), library(letters, "outline")]
+    
+    if method != "squares" and method != "outline":
+        print("Given method is not permitted.\nPermitted methods are: outline, squares, cascade")
+        return []
+    
+    # create default table of characters if necessary
+    if not letters:
+        letters = LETTERS
+        
+    lib = []
+    
+    # get the attributes of every letter
+    for letter in letters:
+        lib.append(char_entry(letter, method))
+    
+    return lib
+
+
+
+def default_library(method="squares"):
+    """
+    default_library(Str) -> List
+    
+    Returns the library of the default characters for the given method,
+    building it the first time it is needed, and reusing it afterwards
+    """
+    
+    if method not in LIBRARIES:
+        LIBRARIES[method] = library(method=method)
+    
+    return LIBRARIES[method]
+
+
+
+def char_entry(letter, method="squares", img=False):
+    """
+    char_entry(Str, Str, Str) -> List
+    
+    Returns the library entry for the given method of a letter, using the
+    image img, or the letter's image file in the same directory by default.
+    Permitted methods are "squares" and "outline"
+    """
+    
+    if method != "squares" and method != "outline":
+        print("Given method is not permitted.\nPermitted methods are: outline, squares")
+        return []
+    
+    # open the image file of the letter
+    if not img:
+        img = char_file(letter)
+    
+    # get the attributes of the given letter
+    out = []
+    pixels = strip(black_and_white(increase_size(get_pixels(img))))
+    
+    if method == "outline":
+        pixels = scale(pixels, 200, 200)
+        out = outline(pixels)
+    
+        # find the dimensions of the 'hole' in the letter, if there is one
+        hole = find_hole(out)
+        
+        # find the total size of the outline
+        size = 0
+        for shape in out:
+            size += len(shape)
+        
+        # add the information to the library
+        return [letter, hole, out, size]
+    
+    # keep the total ink of the squares, for pruning in closest_match
+    squares = get_squares(pixels)
+    return [letter, squares, sum(squares)]
+
+
+
+def add_char(lib, letter, method="squares", img=False):
+    """
+    add_char(List, Str, Str, Str) -> List
+    
+    Adds an entry for a letter to a library built with the given method,
+    using the image img (see char_entry). Any existing entries for the
+    letter are kept, so this can be used to add alternate versions of a
+    letter. For the "cascade" method, an entry is added to both libraries
+    """
+    
+    if method == "cascade":
+        add_char(lib[0], letter, "squares", img)
+        add_char(lib[1], letter, "outline", img)
+        return lib
+    
+    entry = char_entry(letter, method, img)
+    if entry != []:
+        lib.append(entry)
+    
+    return lib
+
+
+
+def replace_char(lib, letter, method="squares", img=False):
+    """
+    replace_char(List, Str, Str, Str) -> List
+    
+    Replaces every entry for a letter in a library built with the given
+    method with one new entry, using the image img (see char_entry). If the
+    letter is not in the library, it is added. For the "cascade" method,
+    the letter is replaced in both libraries
+    """
+    
+    if method == "cascade":
+        replace_char(lib[0], letter, "squares", img)
+        replace_char(lib[1], letter, "outline", img)
+        return lib
+    
+    entry = char_entry(letter, method, img)
+    if entry == []:
+        return lib
+    
+    # put the new entry where the letter first appears, and remove the rest
+    for i in range(len(lib)):
+        if lib[i][0] == letter:
+            lib[i] = entry
+            remove_char(lib, letter, method, i+1)
+            return lib
+    
+    lib.append(entry)
+    
+    return lib
+
+
+
+def remove_char(lib, letter, method="squares", start=0):
+    """
+    remove_char(List, Str, Str, Nat) -> List
+    
+    Removes every entry for a letter from a library built with the given
+    method, from the index start onwards. For the "cascade" method, the
+    letter is removed from both libraries
+    """
+    
+    if method == "cascade":
+        remove_char(lib[0], letter, "squares", start)
+        remove_char(lib[1], letter, "outline", start)
+        return lib
+    
+    i = start
+    while i < len(lib):
+        if lib[i][0] == letter:
+            del lib[i]
+        else:
+            i += 1
+    
+    return lib
+
+
+
+def get_text(img, lib=False, method='squares', threshold=0.25, deskew=False):
+    """
+    get_text(Str) -> Str
+    
+    Given the name of an image, returns the corresponding text. If no library
+    is given, the default library for the method is used (see default_library).
+    A library which is given but empty is used as it is
+    """
+    
+    return read_text(img, lib, method, 1, threshold, deskew)["text"]
+
+
+
+def read_text(img, lib=False, method='squares', k=2, threshold=0.25,
+              deskew=False):
+    """
+    read_text(Str, List, Str, Nat, Num, Bool) -> Dict
+    
+    Given the name of an image, returns the corresponding text. Permitted
+    methods are "squares", "outline" and "cascade", which uses squares for
+    every character, and only uses outline for characters whose closest
+    match is not at least threshold (as a fraction) closer than the second
+    closest (see relative_margin). The number of such characters is given as
+    "escalated". The details of each character found are also returned, in
+    parallel lists (one item for each character):
+        "labels": the closest known character
+        "boxes": the [left, top, right, bottom] of the character in the image
+        "methods": the method ("squares" or "outline") the character was
+                   matched with, which gives the scale of its scores
+        "scores": the distance to the closest known character
+        "margins": how much farther the second closest known character is,
+                   or -1 if it was not found (k < 2). With the "cascade"
+                   method, the squares and outline distances are on very
+                   different scales, so the margin is given as a fraction
+                   of the second closest distance instead (see
+                   relative_margin), for every character
+        "alternatives": the k closest known characters
+        "alt_scores": the distances to the k closest known characters
+    If no library is given, the default library for the method is used. If
+    deskew is True, the image is first rotated so its lines of text are level
+    (see deskew_image), and the angle it was rotated by is given as "angle"
+    (otherwise 0). The boxes are always in the original image
+    """
+    
+    if lib is False:
+        lib = default_library(method)
+    
+    # get black and white version of the image, increased to 3x its size
+    transform = []
+    pixels = get_pixels(img, deskew, transform, True)
+    
+    glyphs = read_pixels(pixels, lib, method, k, threshold)
+    unrotate_boxes(glyphs, transform)
+    
+    return glyphs
+
+
+
+def read_pages(img, lib=False, method='squares', k=2, threshold=0.25,
+               deskew=False):
+    """
+    read_pages(Str, List, Str, Nat, Num, Bool) -> Generator
+    
+    Given the name of an image with several pages (frames), such as a
+    multipage TIFF, yields the text and details of each page (see read_text),
+    in order. The next page is opened and made black and white in the
+    background while the current page is being read
+    """
+    
+    if lib is False:
+        lib = default_library(method)
+    
+    # hold at most one page ahead of the page being read
+    pages = queue.Queue(1)
+    stop = threading.Event()
+    
+    def send(item):
+        # wait for room in the queue, unless reading has stopped
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        
+        return False
+    
+    def load_pages():
+        try:
+            transforms = []
+            for pixels in get_pages(img, deskew, transforms, True):
+                if not send([pixels, transforms[-1]]):
+                    return
+            send(None)
+        
+        # pass any error on to be raised while reading
+        except Exception as e:
+            send(e)
+    
+    loader = threading.Thread(target=load_pages, daemon=True)
+    loader.start()
+    
+    try:
+        page = pages.get()
+        while page is not None:
+            if isinstance(page, Exception):
+                raise page
+            
+            glyphs = read_pixels(page[0], lib, method, k, threshold)
+            unrotate_boxes(glyphs, page[1])
+            yield glyphs
+            page = pages.get()
+    
+    # if reading stops early, let the loader stop too
+    finally:
+        stop.set()
+
+
+
+def read_pixels(pixels, lib, method='squares', k=2, threshold=0.25):
+    """
+    read_pixels(List, List, Str, Nat, Num) -> Dict
+    
+    Given a black and white list of pixels of an image, increased to 3x its
+    size, returns the corresponding text and the details of each character
+    found (see read_text)
+    """
+    
+    glyphs = {"text": "", "labels": [], "boxes": [], "methods": [],
+              "scores": [], "margins": [], "alternatives": [],
+              "alt_scores": [], "escalated": 0, "angle": 0}
+    
+    # split the lines of text. The pixels were increased to 3x their size,
+    # so the lines are found in blocks of 3 rows, and each repeated row is
+    # only checked once
+    tops = []
+    lines = split_lines(pixels, False, tops, 3)
+    for i in range(len(lines)):
+                
+        # find the ink runs of the line once, then use them to split the
+        # characters and find the spaces within the line
+        runs = get_runs(lines[i], False, True)
+        chars = split_chars(lines[i], runs)
+        chars = add_spaces(lines[i], chars, runs)
+        
+        # find the first col of each character
+        starts = []
+        counter = 0
+        for char in chars:
+            if char != -1:
+                starts.append(runs[counter][0])
+                counter += 1
+            else:
+                starts.append(-1)
+        
+        chars = rem_double_chars(chars, starts)
+        
+        # find the average size of characters in the line
+        avg = 0
+        counter = 0
+        for char in chars:
+            if char != -1:
+                avg += len(char)*len(char[0])
+                counter += 1
+        avg = avg/counter
+        
+        # iterate through each character, and add it to the string
+        for ii in range(len(chars)):
+            char = chars[ii]
+            if char == -1:
+                glyphs["text"] += " "
+                continue
+            
+            bounds = strip_bounds(char)
+            char = char[bounds[0]:bounds[1]]
+            if method == "cascade":
+                matches = cascade_matches(char, lib, avg, k, threshold)
+                used = "squares"
+                if matches[1]:
+                    glyphs["escalated"] += 1
+                    used = "outline"
+                matches = matches[0]
+            else:
+                matches = closest_matches(char, lib, avg, method, k)
+                used = method
+            
+            # the character is too small, and should be ignored
+            if matches == []:
+                continue
+            
+            # the image was increased to 3x its size, so scale the box back
+            glyphs["boxes"].append([starts[ii]//3, (tops[i]+bounds[0])//3,
+                                    (starts[ii]+len(char[0]))//3,
+                                    (tops[i]+bounds[1])//3])
+            add_glyph(glyphs, matches, used, method == "cascade")
+                
+        # add a new line where necessary
+        if i != len(lines)-1:
+            glyphs["text"] += "\n"
+    
+    return glyphs
+
+
+
+def unrotate_boxes(glyphs, transform):
+    """
+    unrotate_boxes(Dict, List) -> None
+    
+    Given the characters found by read_pixels in an image rotated by
+    deskew_image, and the transform it gave, moves each box back into the
+    original image, and sets "angle" to the angle the image was rotated by
+    """
+    
+    # the image was not deskewed
+    if transform == []:
+        return
+    
+    glyphs["angle"] = transform[0]
+    if transform[0] == 0:
+        return
+    
+    for i in range(len(glyphs["boxes"])):
+        glyphs["boxes"][i] = unrotate_box(glyphs["boxes"][i], transform)
+
+
+
+def add_glyph(glyphs, matches, method="squares", relative=False):
+    """
+    add_glyph(Dict, List, Str, Bool) -> None
+    
+    Adds the closest matches of a character (see match_squares), found with
+    the given method, to the details of the characters found by read_text.
+    If relative is True, the margin is given as a fraction of the second
+    closest distance (see relative_margin)
+    """
+    
+    glyphs["text"] += matches[0][0]
+    glyphs["labels"].append(matches[0][0])
+    glyphs["methods"].append(method)
+    glyphs["scores"].append(matches[0][1])
+    
+    if len(matches) < 2:
+        glyphs["margins"].append(-1)
+    elif relative:
+        glyphs["margins"].append(relative_margin(matches))
+    else:
+        glyphs["margins"].append(matches[1][2])
+    
+    alternatives = []
+    alt_scores = []
+    for match in matches:
+        alternatives.append(match[0])
+        alt_scores.append(match[1])
+    glyphs["alternatives"].append(alternatives)
+    glyphs["alt_scores"].append(alt_scores)
+
+
+
+def low_confidence(glyphs, margin):
+    """
+    low_confidence(Dict, Num) -> List
+    
+    Given the details of the characters found by read_text, returns the
+    indices of the characters whose margin is below the given margin. For
+    the "cascade" method the margins are fractions (see read_text), so the
+    same margin can be used for characters matched with either method
+    """
+    
+    indices = []
+    for i in range(len(glyphs["margins"])):
+        if glyphs["margins"][i] < margin:
+            indices.append(i)
+    
+    return indices
@@ -0,0 +1,632 @@
+#----------------------------------------------------------#
+# segmentation.py
+
+# Splits black and white lists of pixels into lines of text,
+# and lines of text into individual characters. This module
+# does not need PIL, so it is cheap to import
+#----------------------------------------------------------#
+
+import math
+
+
+# skew_angle only finds an angle if there are at least this many black
+# pixels, and only rotates if the angle is at least this much (as a
+# fraction) more uneven than 0 degrees, since a few characters on a level
+# line are often more uneven at a small angle
+SKEW_MIN_INK = 1000
+SKEW_MIN_GAIN = 0.1
+
+
+
+# functions for splitting pixels into lines and characters
+# -----------------------------------------------------------------
+def black_and_white(pixels):
+    """
+    black_and_white(List) -> List
+    
+    Given a list of pixels, sets every pixel to be either pure white, or
+    pure black
+    """
+    
+    # iterate through each pixel in pixels
+    for row in range(len(pixels)):
+        for col in range(len(pixels[row])):
+            
+            #check if the pixel is near enough to black
+            if sum(pixels[row][col]) < 465:
+                #if it is, set it to pure black
+                pixels[row][col] = (0,0,0)
+                
+            else:
+                #otherwise set it to pure white
+                pixels[row][col] = (255,255,255)
+    
+    return pixels
+
+
+
+def increase_size(pixels):
+    """
+    increase_size(List) -> List
+    
+    Replaces each pixel in pixels with a 3x3 square of itself
+    """
+    
+    # iterate through each row in pixels
+    new_pixels = []
+    for row in range(len(pixels)):
+        # replace each row with its new scaled row
+        new_row = increase_size_row(pixels[row])
+        new_pixels.extend(new_row)
+    
+    return new_pixels
+
+
+
+def increase_size_row(row):
+    """
+    increase_size_row(List) -> List
+    
+    Replaces each pixels in row of pixels with a 3x3 square of itself
+    """
+    
+    new_row = []
+    for pixel in row:
+        new_row.extend([pixel]*3)
+    
+    return [new_row]*3    
+
+
+
+def split_lines(pixels, small=False, starts=False, factor=1):
+    """
+    split_lines(List) -> List
+    
+    Given a list of pixels, splits the pixels into a list of lines of text.
+    If a list is given for starts, the first row of each line is added to it.
+    If factor is more than 1, the lines are first looked for in blocks of
+    factor rows (see get_coarse_runs)
+    """
+    
+    # get the vertical line splits
+    line_splits = get_splits(pixels, True, False, small, factor)
+    
+    # iterate through line splits, and create a list of lines
+    lines = []
+    for i in range(0, len(line_splits), 2):
+        start = line_splits[i]
+        end = line_splits[i+1]
+        temp_line = []
+        
+        for row in range(start, end):
+            temp_line.append(pixels[row][:])
+        
+        lines.append(temp_line)
+        if starts != False:
+            starts.append(start)
+    
+    return lines
+
+
+
+def split_chars(pixels, runs=False):
+    """
+    split_chars(List) -> List
+    
+    Given a list of pixels, splits the pixels horizontally into a list of 
+    individual characters. If the runs of the line have already been found
+    (see get_runs), they can be given to avoid searching the line again
+    """
+    
+    # get the horizontal ink runs
+    if not runs:
+        runs = get_runs(pixels, False, True)
+    
+    # iterate through the runs, and create a list of characters
+    characters = []
+    for run in runs:
+        temp_char = []
+        
+        for row in range(len(pixels)):
+            temp_char.append(pixels[row][run[0]:run[1]])
+        
+        characters.append(temp_char)
+    
+    return characters 
+
+
+
+def get_runs(pixels, vert=False, horz=False, factor=1):
+    """
+    get_runs(List, Bool, Bool, Nat) -> List
+    
+    Given a list of pixels, returns a run-length encoding of the non-white
+    rows (if vert is True) or cols (if horz is True), as a list of
+    [start, end] pairs, where start is the first non-white row/col of a run
+    and end is the first white row/col after it. If factor is more than 1,
+    the rows are found using get_coarse_runs
+    """
+    
+    if vert and factor > 1:
+        return get_coarse_runs(pixels, factor)
+    
+    runs = []
+    start = -1
+    
+    if vert:
+        length = len(pixels)
+    else:
+        length = len(pixels[0])
+    
+    # walk over the rows (or cols) once, opening a run at the first non-white
+    # row/col and closing it at the first white row/col afterwards
+    for i in range(length):
+        if vert:
+            inked = is_inked(pixels[i])
+        else:
+            inked = False
+            for row in pixels:
+                if row[i] != (255,255,255):
+                    inked = True
+                    break
+        
+        if inked and start == -1:
+            start = i
+        elif not inked and start != -1:
+            runs.append([start, i])
+            start = -1
+    
+    # close the last run if it reaches the edge of the pixels
+    if start != -1:
+        runs.append([start, length])
+    
+    return runs
+
+
+
+def get_coarse_runs(pixels, factor):
+    """
+    get_coarse_runs(List, Nat) -> List
+    
+    Returns the same runs of non-white rows as get_runs, for any factor. The
+    rows are first reduced to blocks of factor rows, where a block is inked
+    if any of its pixels are, stopping at the first inked row of each block.
+    Then only the rows after that, in inked blocks, are checked, to find
+    where the runs start and end and any gaps between lines within a block.
+    A row which is the same list as the row before it (as increase_size
+    makes) is not checked again
+    """
+    
+    # find the first inked row of each block, or -1 if the block is white
+    firsts = []
+    for top in range(0, len(pixels), factor):
+        first = -1
+        for row in range(top, min(len(pixels), top+factor)):
+            if is_inked(pixels[row]):
+                first = row
+                break
+        firsts.append(first)
+    
+    runs = []
+    start = -1
+    for block in range(len(firsts)):
+        top = block*factor
+        
+        # a white block closes any run before it
+        if firsts[block] == -1:
+            if start != -1:
+                runs.append([start, top])
+                start = -1
+            continue
+        
+        for row in range(top, min(len(pixels), top+factor)):
+            if row < firsts[block]:
+                inked = False
+            elif row == firsts[block]:
+                inked = True
+            elif pixels[row] is not pixels[row-1]:
+                inked = is_inked(pixels[row])
+            
+            if inked and start == -1:
+                start = row
+            elif not inked and start != -1:
+                runs.append([start, row])
+                start = -1
+    
+    # close the last run if it reaches the edge of the pixels
+    if start != -1:
+        runs.append([start, len(pixels)])
+    
+    return runs
+
+
+
+def is_inked(row):
+    """
+    is_inked(List) -> Bool
+    
+    Returns True if the given row of pixels has any non-white pixels
+    """
+    
+    for pixel in row:
+        if pixel != (255,255,255):
+            return True
+    
+    return False
+
+
+
+def merge_small_runs(runs):
+    """
+    merge_small_runs(List) -> List
+    
+    Given a list of runs (see get_runs), adds each run which is less than
+    half the average run size to the run afterwards
+    """
+    
+    #find the average run size
+    sum1 = 0
+    for run in runs:
+        sum1 += run[1]-run[0]-1
+    avg = sum1/len(runs)
+    
+    # if a run is less than half the average, add it to the run afterwards
+    # since it may be the dot of a lower-case 'i' (for example)
+    new_runs = []
+    start = -1
+    for i in range(len(runs)):
+        if start == -1:
+            start = runs[i][0]
+        
+        if runs[i][1]-runs[i][0]-1 >= avg/2 or i == len(runs)-1:
+            new_runs.append([start, runs[i][1]])
+            start = -1
+    
+    return new_runs
+
+
+
+def runs_to_splits(runs):
+    """
+    runs_to_splits(List) -> List
+    
+    Flattens a list of runs (see get_runs) into the list of splits returned
+    by get_splits
+    """
+    
+    line_splits = []
+    for run in runs:
+        line_splits.extend(run)
+    
+    return line_splits
+
+
+
+def get_gaps(runs):
+    """
+    get_gaps(List) -> List
+    
+    Given a list of runs (see get_runs), returns the size of the white gap
+    before each run
+    """
+    
+    gaps = []
+    end = 0
+    for run in runs:
+        gaps.append(run[0]-end)
+        end = run[1]
+    
+    return gaps
+
+
+
+def get_splits(pixels, vert=False, horz=False, small=False, factor=1):
+    """
+    get_vert_splits(List) -> List
+    
+    Given a list of pixels, returns a list, where each even index is a row # 
+    which is non-white, and occurs directly after a white row, and every odd 
+    index is the row # which is the first occurence of a white row after the  
+    row # of the index prior 
+    """
+    
+    runs = get_runs(pixels, vert, horz, factor)
+    
+    # small lines are added to the line afterwards, unless told otherwise
+    if vert and not small:
+        runs = merge_small_runs(runs)
+    
+    return runs_to_splits(runs)
+
+
+
+def add_spaces(line, chars, runs=False):
+    """
+    add_spaces(List) -> List
+    
+    Given a list of pixels for a line of text, determines the positions where
+    there are spaces. If the runs of the line have already been found
+    (see get_runs), they can be given to avoid searching the line again
+    """
+    
+    if not runs:
+        runs = get_runs(line, False, True)
+    
+    # find the splits where there likely is a space
+    spaces = find_spaces(get_gaps(runs))
+    
+    # add the spaces to the chars in the line
+    new_chars = []
+    for i in range(len(chars)):
+        if i in spaces and i != 0:
+            new_chars.append(-1)         
+        new_chars.append(chars[i])
+               
+    return new_chars
+
+
+
+def find_spaces(gaps):
+    """
+    find_spaces(List) -> List
+    
+    Given the gaps before each character on a line, returns the indices of
+    the gaps which are likely to be spaces
+    """
+    
+    # find the average gap
+    sum_gaps = 0
+    for gap in gaps:
+        sum_gaps += gap
+    avg = sum_gaps/len(gaps)
+    
+    # a gap well above the average is likely a space
+    spaces = []
+    for i in range(len(gaps)):
+        if gaps[i]/avg > 1.25:
+            spaces.append(i)
+    
+    return spaces
+
+
+
+def strip(pixels):
+    """
+    strip(List) -> List
+    
+    Removes excess white lines at the top and bottom of a given list of pixels
+    """
+    
+    bounds = strip_bounds(pixels)
+    
+    # get the rows from start to end
+    return pixels[bounds[0]:bounds[1]]
+
+
+
+def strip_bounds(pixels):
+    """
+    strip_bounds(List) -> List
+    
+    Returns [start, end], where start is the first non-white row of a given
+    list of pixels, and end is the row after the last non-white row
+    """
+    
+    start = -1
+    end = -1
+    
+    # iterate through each row, to find the first non-white row
+    for row in range(len(pixels)):
+        if is_inked(pixels[row]):
+            start = row
+            break
+    
+    # now, iterate through the rows in reverse, to find the last non-white row
+    for row in range(len(pixels)-1, -1, -1):
+        if is_inked(pixels[row]):
+            end = row+1
+            break
+    
+    return [start, end]
+
+
+
+def scale(pixels, height, width):
+    """
+    scale(List, Nat, Nat) -> List
+    
+    Given a list of pixels, adjusts it such that its dimensions are the
+    specified width and height
+    """
+    
+    # constant for future comparisons
+    bw = [(0,0,0), (255,255,255)]
+    
+    # while the image is too small, increase its size
+    while len(pixels) < height or len(pixels[0]) < width:
+        pixels = increase_size(pixels)
+    
+    # find the dimensions of the rectangles to be compressed to
+    # individual pixels
+    heights = apportion(len(pixels), height)
+    widths = apportion(len(pixels[0]), width)
+    
+    new_pixels = []
+    for i in range(len(heights)-1):
+        temp_row = []
+        for ii in range(len(widths)-1):
+            
+            # collect all the pixels in the 'rectangle'
+            bw_counter = [0,0]
+            for row in range(heights[i], heights[i+1]):
+                for col in range(widths[ii], widths[ii+1]):
+                    if pixels[row][col] == (0,0,0):
+                        bw_counter[0] += 1
+                    else:
+                        bw_counter[1] += 1
+            
+            # add the dominant colour in the 'rectangle' to the new row
+            temp_row.append(bw[bw_counter.index(max(bw_counter))])
+        
+        # add the new row to the new image
+        new_pixels.append(temp_row)
+    
+    return new_pixels
+
+
+
+def rem_double_chars(chars, starts=False):
+    """
+    rem_double_chars(List) -> List
+    
+    Given a list of chars, splits chars which are predicted to be an image of
+    two chars as opposed to one. If a list of the first col of each char is
+    given for starts, it is updated to match the new list of chars
+    """
+    
+    # find the average width of characters on the line
+    sum_widths = 0
+    counter = 0
+    for i in range(len(chars)):
+        if chars[i] != -1:
+            sum_widths += len(chars[i][0])
+            counter += 1
+    avg = sum_widths/counter
+    
+    new_chars = []
+    new_starts = []
+    for i in range(len(chars)):
+        
+        # check if the given character is suspiciously wide, and is not a space
+        if chars[i] != -1 and len(chars[i][0])/avg > 1.5:
+            
+            # if so, check the columns near the middle
+            split = -1
+            mid = len(chars[i][0])//2
+            for col in range(max(0, mid-5), min(len(chars[i][0])-1, mid+5)):
+                path = False
+                for row in range(1, len(chars[i])-1):
+                    
+                    # if there is a black pixel, check to see if it connected
+                    if chars[i][row][col] == (0,0,0):
+                        if chars[i][row][col+1] == (0,0,0) or chars[i][row+1][col+1] == (0,0,0) or chars[i][row-1][col+1] == (0,0,0):
+                            path = True
+                
+                # if a column only has unconnected black pixels, this should be
+                # the split point
+                if not path:
+                    split = col
+            
+            if split != -1:
+                # if a split point has been found, separate the image into
+                # two new characters
+                char1 = []
+                char2 = []
+                for row in range(len(chars[i])):
+                    char1.append(chars[i][row][:split+1])
+                    char2.append(chars[i][row][split+1:])
+            
+                new_chars.extend([char1,char2])
+                if starts != False:
+                    new_starts.extend([starts[i], starts[i]+split+1])
+            
+            else:
+                new_chars.append(chars[i])
+                if starts != False:
+                    new_starts.append(starts[i])
+        else:
+            new_chars.append(chars[i])
+            if starts != False:
+                new_starts.append(starts[i])
+    
+    if starts != False:
+        starts[:] = new_starts
+    
+    return new_chars
+
+
+
+def skew_angle(pixels, angles=False):
+    """
+    skew_angle(List, List) -> Num
+    
+    Given a (small) list of black and white pixels, returns the angle, in
+    degrees, the lines of text are rotated by. Each angle in angles (by
+    default -5 to 5, in steps of 0.5) is tried, and the angle where the
+    rows of black pixels are most uneven (where the lines of text and the
+    gaps between them are sharpest) is chosen. If there are too few black
+    pixels to trust, or no angle is clearly more uneven than 0, returns 0
+    (see SKEW_MIN_INK and SKEW_MIN_GAIN)
+    """
+    
+    if not angles:
+        angles = []
+        for i in range(-10, 11):
+            angles.append(i/2)
+    
+    # find the black pixels once
+    black = []
+    for row in range(len(pixels)):
+        for col in range(len(pixels[row])):
+            if pixels[row][col] == (0,0,0):
+                black.append([row, col])
+    
+    if len(black) < SKEW_MIN_INK:
+        return 0
+    
+    # try the smallest angles first, so an angle is only chosen over a
+    # smaller one if it is strictly better
+    order = []
+    for angle in angles:
+        order.append([abs(angle), angle])
+    order.sort()
+    
+    best = [-1, 0]
+    level = -1
+    for item in order:
+        # count the black pixels in each row, after undoing the angle
+        slope = math.tan(math.radians(item[1]))
+        counts = {}
+        for c in black:
+            row = round(c[0]-c[1]*slope)
+            counts[row] = counts.get(row, 0)+1
+        
+        # since the total is the same for every angle, the sum of the
+        # squares of the counts grows with their variance
+        score = 0
+        for row in counts:
+            score += counts[row]**2
+        
+        if item[1] == 0:
+            level = score
+        if score > best[0]:
+            best = [score, item[1]]
+    
+    # keep the image level unless the angle is clearly better
+    if level != -1 and best[0] < level*(1+SKEW_MIN_GAIN):
+        return 0
+    
+    return best[1]
+
+
+# Miscellaneous functions
+# -----------------------------------------------------------------
+def apportion(num, div):
+    
+    # determine the two possible numbers in the list of divisors
+    small = num//div
+    large = (num//div)+1
+    
+    # add the small divisor to the list (and remove it from num), until
+    # the remainder can be finished using the large divisor
+    divs = [0]
+    while num != 0:
+        if (div-len(divs)+1)*large == num:
+            divs.append(large+divs[-1])
+            num -= large
+        
+        else:
+            divs.append(small+divs[-1])
+            num -= small
+    
+    return divs
@@ -0,0 +1,224 @@
+#----------------------------------------------------------#
+# shared.py
+
+# Saves a built library to a file which several processes can
+# memory-map read-only, so the library is built once, and its
+# attributes are held in memory once, however many processes
+# use it
+#----------------------------------------------------------#
+
+import array
+import json
+import mmap
+import os
+import struct
+
+
+# the size of the number at the start of the file which gives the size of
+# its header
+HEADER_SIZE = struct.calcsize("<Q")
+
+
+
+# Functions for sharing libraries between processes
+# -----------------------------------------------------------------
+def save_library(lib, method, path):
+    """
+    save_library(List, Str, Str) -> None
+    
+    Saves a library built with the given method (see library) to a file,
+    which can be attached to by any number of processes (see attach_library).
+    Each attribute is kept for every character in one block of the file
+    (for example, every character's squares one after the other), so the
+    file can be read without making anything for each character. The file
+    is written under a temporary name, then renamed, so a process never
+    attaches to a half written library
+    """
+    
+    if method == "cascade":
+        parts = [["squares", lib[0]], ["outline", lib[1]]]
+    else:
+        parts = [[method, lib]]
+    
+    data = bytearray()
+    blocks = []
+    for part in parts:
+        # the letters are kept as one string, with the offset of each
+        letters = bytearray()
+        letter_offsets = array.array("q", [0])
+        for item in part[1]:
+            letters.extend(item[0].encode())
+            letter_offsets.append(len(letters))
+        
+        block = {"kind": part[0], "count": len(part[1]),
+                 "letters": add_block(data, letters),
+                 "letter_offsets": add_block(data, letter_offsets)}
+        
+        if part[0] == "outline":
+            # the points of every shape are kept in one block, with a table
+            # of where each shape starts, and of each character's shapes
+            holes = array.array("q")
+            sizes = array.array("q")
+            shape_starts = array.array("q", [0])
+            shapes = array.array("q")
+            points = array.array("i")
+            for item in part[1]:
+                holes.append(item[1])
+                sizes.append(item[3])
+                for shape in item[2]:
+                    shapes.extend([len(points), len(shape)])
+                    for c in shape:
+                        points.extend(c)
+                shape_starts.append(len(shapes)//2)
+            
+            block["holes"] = add_block(data, holes)
+            block["sizes"] = add_block(data, sizes)
+            block["shape_starts"] = add_block(data, shape_starts)
+            block["shapes"] = add_block(data, shapes)
+            block["points"] = add_block(data, points)
+        
+        else:
+            # the squares are kept as one matrix, one row for each character
+            stride = 0
+            if part[1] != []:
+                stride = len(part[1][0][1])
+            squares = array.array("d")
+            ink = array.array("d")
+            for item in part[1]:
+                squares.extend(item[1])
+                ink.append(item[2])
+            
+            block["stride"] = stride
+            block["squares"] = add_block(data, squares)
+            block["ink"] = add_block(data, ink)
+        
+        blocks.append(block)
+    
+    # the header gives the method, and where each block is in the data
+    header = json.dumps({"method": method, "parts": blocks}).encode()
+    header += b" "*(-(HEADER_SIZE+len(header)) % 8)
+    
+    with open(path + ".tmp", "wb") as f:
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        f.write(data)
+    os.replace(path + ".tmp", path)
+
+
+
+def add_block(data, values):
+    """
+    add_block(bytearray, array) -> List
+    
+    Adds the bytes of values to the end of data, starting on a multiple of
+    8 bytes, and returns [offset, type code, number of values] for the block
+    """
+    
+    data.extend(bytes(-len(data) % 8))
+    offset = len(data)
+    data.extend(bytes(values))
+    
+    if isinstance(values, array.array):
+        return [offset, values.typecode, len(values)]
+    
+    return [offset, "B", len(values)]
+
+
+
+def attach_library(path):
+    """
+    attach_library(Str) -> List
+    
+    Returns the library saved to a file by save_library. The file is
+    memory-mapped read-only, and the library reads the attributes of each
+    character straight from it when they are needed (see SharedLibrary), so
+    processes attached to the same file share its memory, and attaching
+    takes the same time however large the library is
+    """
+    
+    with open(path, "rb") as f:
+        view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    
+    size = struct.unpack("<Q", view[:HEADER_SIZE])[0]
+    header = json.loads(bytes(view[HEADER_SIZE:HEADER_SIZE+size]))
+    data = view[HEADER_SIZE+size:]
+    
+    parts = []
+    for block in header["parts"]:
+        parts.append(SharedLibrary(data, block))
+    
+    if header["method"] == "cascade":
+        return parts
+    
+    return parts[0]
+
+
+
+class SharedLibrary:
+    """
+    A read-only library saved by save_library. Each entry is made from the
+    shared file when it is indexed, in the same form as the entries made by
+    library, so it can be used anywhere a library can. To change the
+    library, make a copy with list() first
+    """
+    
+    def __init__(self, data, block):
+        self.kind = block["kind"]
+        self.count = block["count"]
+        
+        # a read-only view of each block of the file
+        self.blocks = {}
+        for name in block:
+            if isinstance(block[name], list):
+                offset, code, count = block[name]
+                size = count*struct.calcsize(code)
+                self.blocks[name] = data[offset:offset+size].cast(code)
+        
+        if self.kind == "squares":
+            self.stride = block["stride"]
+    
+    def __len__(self):
+        return self.count
+    
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("library index out of range")
+        
+        offsets = self.blocks["letter_offsets"]
+        letter = bytes(self.blocks["letters"][offsets[i]:offsets[i+1]]).decode()
+        
+        if self.kind == "outline":
+            shapes = []
+            starts = self.blocks["shape_starts"]
+            for shape in range(starts[i], starts[i+1]):
+                start = self.blocks["shapes"][2*shape]
+                length = self.blocks["shapes"][2*shape+1]
+                shapes.append(SharedShape(self.blocks["points"][start:start+2*length]))
+            return [letter, self.blocks["holes"][i], shapes, self.blocks["sizes"][i]]
+        
+        squares = self.blocks["squares"][i*self.stride:(i+1)*self.stride]
+        return [letter, squares, self.blocks["ink"][i]]
+
+
+
+class SharedShape:
+    """
+    The outline of a shape in a library saved by save_library, which reads
+    each [col, row] coordinate from the shared file when it is needed
+    """
+    
+    def __init__(self, points):
+        self.points = points
+    
+    def __len__(self):
+        return len(self.points)//2
+    
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("shape index out of range")
+        
+        return [self.points[2*i], self.points[2*i+1]]